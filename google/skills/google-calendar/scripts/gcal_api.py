@@ -1,84 +1,566 @@
 #!/usr/bin/env python3
 import argparse
+import copy
+import datetime
+import functools
+import itertools
 import json
 import os
-import pathlib
+import re
 import sys
-from typing import Any, Dict, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Protocol, Tuple
+from urllib.parse import urlencode, urlsplit
 
-from google.auth.transport.requests import AuthorizedSession, Request
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.credentials import Credentials
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from token_store import auth_request, write_token
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON parse/serialize
+    orjson = None
+
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+except ImportError:  # optional: incremental parsing of --all-pages responses
+    ijson = None
 
 CALENDAR_BASE_URL = "https://www.googleapis.com/calendar/v3"
 TASKS_BASE_URL = "https://tasks.googleapis.com/tasks/v1"
 DEFAULT_CALENDAR_SCOPES = ["https://www.googleapis.com/auth/calendar"]
 DEFAULT_TASKS_SCOPES = ["https://www.googleapis.com/auth/tasks"]
+DEFAULT_TOKEN_PATH = os.path.expanduser("~/.config/google-calendar/token.json")
+CALENDAR_BATCH_URL = "https://www.googleapis.com/batch/calendar/v3"
+TASKS_BATCH_URL = "https://tasks.googleapis.com/batch"
+BATCH_MAX_OPS = 50
+BULK_CONCURRENCY = 20
+BULK_RATE = 10.0
+POOLED_HOSTS = ("https://www.googleapis.com", "https://tasks.googleapis.com")
+REFRESH_AHEAD_SECONDS = 300
+REFRESH_JOIN_TIMEOUT = 10.0
+CRED_CACHE_SIZE = 8
+JSON_FILE_CACHE_SIZE = 32
+
+_EVENTS_PATH = "/calendars/{}/events"
+_EVENT_PATH = "/calendars/{}/events/{}"
+_TASKLIST_PATH = "/users/@me/lists/{}"
+_TASKS_PATH = "/lists/{}/tasks"
+_TASK_PATH = "/lists/{}/tasks/{}"
+_TASK_MOVE_PATH = "/lists/{}/tasks/{}/move"
+_TASKS_CLEAR_PATH = "/lists/{}/clear"
+_TRUE = frozenset({"true", "1", "yes", "y"})
+_FALSE = frozenset({"false", "0", "no", "n"})
+_EMAIL_SPLIT = re.compile(r"[^,\s]+")
+_TZ_SUFFIX_RE = re.compile(r"(Z|[+-]\d{2}:?\d{2})$")
+_NO_ITEM = object()
+_BATCH_ITEM_RE = re.compile(r"<response-item(\d+)>")
+_JSON_FILE_CACHE: "OrderedDict[Tuple[str, int, int], Any]" = OrderedDict()
+_CRED_CACHE: "OrderedDict[Tuple[str, float, Tuple[str, ...]], Credentials]" = OrderedDict()
+_CRED_LOCK = threading.Lock()
+_REFRESH_THREADS: Dict[Tuple[str, Tuple[str, ...]], threading.Thread] = {}
+
+
+def json_loads(data: Any) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+def json_dumps_pretty(value: Any, sort_keys: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | (orjson.OPT_SORT_KEYS if sort_keys else 0))
+    return json.dumps(value, indent=2, sort_keys=sort_keys, ensure_ascii=False).encode("utf-8")
+
+
+def write_json(value: Any, out: BinaryIO, sort_keys: bool = False) -> None:
+    if orjson is not None:
+        out.write(json_dumps_pretty(value, sort_keys))
+    else:
+        for chunk in json.JSONEncoder(indent=2, sort_keys=sort_keys, ensure_ascii=False).iterencode(value):
+            out.write(chunk.encode("utf-8"))
+    out.write(b"\n")
+
+
+def write_json_items(items: Iterator[Any], out: BinaryIO, sort_keys: bool = False) -> None:
+    # Emit a JSON array one element at a time so only the current page is held in memory.
+    # Pull the first item before writing anything so an error on the first page leaves stdout empty.
+    items = iter(items)
+    first = next(items, _NO_ITEM)
+    out.write(b"[")
+    if first is _NO_ITEM:
+        out.write(b"]\n")
+        return
+    separator = b"\n  "
+    for item in itertools.chain((first,), items):
+        out.write(separator)
+        out.write(json_dumps_pretty(item, sort_keys).replace(b"\n", b"\n  "))
+        separator = b",\n  "
+    out.write(b"\n]\n")
+
+
+def _load_json_file(path: str) -> Any:
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    if key in _JSON_FILE_CACHE:
+        _JSON_FILE_CACHE.move_to_end(key)
+        return _JSON_FILE_CACHE[key]
+    with open(path, "rb") as handle:
+        value = json_loads(handle.read())
+    _JSON_FILE_CACHE[key] = value
+    if len(_JSON_FILE_CACHE) > JSON_FILE_CACHE_SIZE:
+        _JSON_FILE_CACHE.popitem(last=False)
+    return value
 
 
 def load_json_input(raw: Optional[str], path: Optional[str]) -> Optional[Dict[str, Any]]:
     if raw and path:
         raise ValueError("Use only one of --body/--params or --body-file/--params-file")
     if path:
-        with open(path, "r", encoding="utf-8") as handle:
-            return json.load(handle)
+        return copy.deepcopy(_load_json_file(path))
     if raw:
-        return json.loads(raw)
+        return json_loads(raw)
     return None
 
 
+def _cache_credentials(key: Tuple[str, float, Tuple[str, ...]], creds: Credentials) -> None:
+    # Drop entries for older mtimes of the same token file, then cap the cache like _JSON_FILE_CACHE.
+    # Locked because the background refresh thread updates the cache too.
+    with _CRED_LOCK:
+        for stale in [k for k in _CRED_CACHE if k[0] == key[0] and k[2] == key[2] and k != key]:
+            del _CRED_CACHE[stale]
+        _CRED_CACHE[key] = creds
+        _CRED_CACHE.move_to_end(key)
+        if len(_CRED_CACHE) > CRED_CACHE_SIZE:
+            _CRED_CACHE.popitem(last=False)
+
+
+def _refresh_and_store(creds: Credentials, resolved: str, scopes_key: Tuple[str, ...]) -> None:
+    creds.refresh(auth_request())
+    write_token(resolved, creds.to_json())
+    _cache_credentials((resolved, os.stat(resolved).st_mtime, scopes_key), creds)
+
+
+def _background_refresh(creds: Credentials, resolved: str, scopes_key: Tuple[str, ...]) -> None:
+    try:
+        _refresh_and_store(creds, resolved, scopes_key)
+    except Exception:
+        # The current token is still valid; a later call refreshes inline once it expires.
+        pass
+
+
+def wait_for_background_refresh(timeout: float = REFRESH_JOIN_TIMEOUT) -> None:
+    # Give in-flight refreshes a chance to write the new token back before the process exits.
+    deadline = time.monotonic() + timeout
+    for thread in list(_REFRESH_THREADS.values()):
+        thread.join(max(0.0, deadline - time.monotonic()))
+
+
 def load_credentials(token_path: str, scopes: Optional[list]) -> Credentials:
-    resolved = pathlib.Path(token_path).expanduser().resolve()
-    if not resolved.exists():
-        raise FileNotFoundError(f"Token file not found: {resolved}")
-    creds = Credentials.from_authorized_user_file(str(resolved), scopes=scopes)
-    if creds.expired and creds.refresh_token:
-        creds.refresh(Request())
-        resolved.write_text(creds.to_json())
+    resolved = os.path.abspath(os.path.expanduser(token_path))
+    try:
+        st = os.stat(resolved)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Token file not found: {resolved}") from None
+    scopes_key = tuple(scopes or ())
+    key = (resolved, st.st_mtime, scopes_key)
+    with _CRED_LOCK:
+        creds = _CRED_CACHE.get(key)
+    if creds is None:
+        creds = Credentials.from_authorized_user_file(resolved, scopes=scopes)
+    _cache_credentials(key, creds)
+    if not creds.refresh_token:
+        return creds
+    if creds.expired:
+        _refresh_and_store(creds, resolved, scopes_key)
+    elif creds.expiry is not None:
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        if (creds.expiry - now).total_seconds() < REFRESH_AHEAD_SECONDS:
+            # Token is still usable; refresh it off the request path unless a refresh is already running.
+            pending = _REFRESH_THREADS.get((resolved, scopes_key))
+            if pending is None or not pending.is_alive():
+                refresher = threading.Thread(
+                    target=_background_refresh,
+                    args=(creds, resolved, scopes_key),
+                    daemon=True,
+                )
+                _REFRESH_THREADS[(resolved, scopes_key)] = refresher
+                refresher.start()
     return creds
 
 
 def session_from_token(token_path: str, scopes: Optional[list]) -> AuthorizedSession:
     creds = load_credentials(token_path, scopes)
-    return AuthorizedSession(creds)
+    session = AuthorizedSession(creds)
+    # POST/PATCH are never replayed, and neither is DELETE: a replay after a server-side success
+    # would report a spurious 404/410. Once retries run out the last response is returned as-is
+    # so raise_for_response can show Google's error body.
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS - {"DELETE"},
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    for host in POOLED_HOSTS:
+        session.mount(host, adapter)
+    return session
+
+
+class HttpBackend(Protocol):
+    def request(self, method: str, url: str, **kwargs: Any) -> Any: ...
+
+    def post(self, url: str, **kwargs: Any) -> Any: ...
+
+
+def _import_httpx() -> Any:
+    try:
+        import httpx
+    except ImportError as exc:
+        raise RuntimeError("--http2 requires httpx with HTTP/2 support: pip install 'httpx[http2]'") from exc
+    return httpx
+
+
+def _http2_limits(httpx: Any) -> Any:
+    return httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+
+class Http2Session:
+    def __init__(self, creds: Credentials) -> None:
+        _import_httpx()
+        self.creds = creds
+        self._client: Any = None
+
+    @property
+    def client(self) -> Any:
+        # Created on first sync request; bulk only borrows the credentials and runs its own AsyncClient.
+        if self._client is None:
+            httpx = _import_httpx()
+            self._client = httpx.Client(http2=True, limits=_http2_limits(httpx))
+        return self._client
+
+    def auth_headers(self, headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        if not self.creds.valid and self.creds.refresh_token:
+            self.creds.refresh(auth_request())
+        merged = dict(headers or {})
+        merged["Authorization"] = f"Bearer {self.creds.token}"
+        return merged
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        response = self._send(method, url, params, data, headers)
+        if response.status_code == 401 and self.creds.refresh_token:
+            self.creds.refresh(auth_request())
+            response = self._send(method, url, params, data, headers)
+        return response
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[bytes],
+        headers: Optional[Dict[str, str]],
+    ) -> Any:
+        headers = self.auth_headers(headers)
+        return self.client.request(method, url, params=params, content=data, headers=headers)
+
+    def post(self, url: str, data: Optional[bytes] = None, headers: Optional[Dict[str, str]] = None) -> Any:
+        return self.request("POST", url, data=data, headers=headers)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_session(token_path: str, scopes: Tuple[str, ...], http2: bool) -> HttpBackend:
+    # Reuse one session per token/scopes so repeated calls keep sockets alive.
+    if http2:
+        return Http2Session(load_credentials(token_path, list(scopes)))
+    return session_from_token(token_path, list(scopes))
+
+
+def _get_session(token_path: str, scopes: Tuple[str, ...], http2: bool = False) -> HttpBackend:
+    # Only the transport is cached. Credentials are re-checked on every call so a token rewritten
+    # on disk is picked up and refresh-ahead/write-back still happen for long-running callers.
+    creds = load_credentials(token_path, list(scopes))
+    session = _cached_session(token_path, scopes, http2)
+    if isinstance(session, Http2Session):
+        session.creds = creds
+    else:
+        session.credentials = creds
+    return session
+
+
+def build_url(path: str, base_url: str = CALENDAR_BASE_URL) -> str:
+    return path if path[:4] == "http" else base_url + ("" if path[:1] == "/" else "/") + path
+
+
+def raise_for_response(response: Any) -> None:
+    if response.status_code < 400:
+        return
+    if "application/json" in response.headers.get("Content-Type", ""):
+        error_payload = json_loads(response.content)
+    else:
+        error_payload = {"error": response.text}
+    raise RuntimeError(f"HTTP {response.status_code}: {json_dumps_pretty(error_payload).decode('utf-8')}")
 
 
 def request(
-    session: AuthorizedSession,
+    session: HttpBackend,
     method: str,
     path: str,
     params: Optional[Dict[str, Any]],
     body: Any,
     base_url: str = CALENDAR_BASE_URL,
+    body_bytes: Optional[bytes] = None,
 ) -> Any:
-    if path.startswith("http://") or path.startswith("https://"):
-        url = path
-    else:
-        if not path.startswith("/"):
-            path = "/" + path
-        url = base_url + path
-
-    response = session.request(method=method, url=url, params=params, json=body)
+    # body_bytes lets callers reuse an already-serialized JSON body across calls.
+    url = build_url(path, base_url)
+    data = body_bytes
+    if data is None and body is not None:
+        data = json_dumps(body)
+    headers = {"Content-Type": "application/json"} if data is not None else None
+    response = session.request(method=method, url=url, params=params, data=data, headers=headers)
     content_type = response.headers.get("Content-Type", "")
-
-    if response.status_code >= 400:
-        if "application/json" in content_type:
-            error_payload = response.json()
-        else:
-            error_payload = {"error": response.text}
-        raise RuntimeError(f"HTTP {response.status_code}: {json.dumps(error_payload, indent=2)}")
+    raise_for_response(response)
 
     if response.status_code == 204:
         return {"status": "deleted"}
 
     if "application/json" in content_type:
-        return response.json()
+        return json_loads(response.content)
     return {"text": response.text}
 
 
+def _stream_page_items(
+    session: AuthorizedSession,
+    url: str,
+    params: Dict[str, Any],
+    page: Dict[str, Any],
+) -> Iterator[Any]:
+    # Parse items while the body is still downloading; nextPageToken is stored into `page`.
+    with session.request("GET", url, params=params, stream=True) as response:
+        raise_for_response(response)
+        response.raw.decode_content = True
+        builder = None
+        for prefix, event, value in ijson.parse(response.raw, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == "items.item" and event == "end_map":
+                    yield builder.value
+                    builder = None
+            elif prefix == "items.item" and event == "start_map":
+                builder = ObjectBuilder()
+                builder.event(event, value)
+            elif prefix == "nextPageToken" and event == "string":
+                page["nextPageToken"] = value
+
+
+def iter_items(
+    session: HttpBackend,
+    path: str,
+    params: Dict[str, Any],
+    base_url: str = CALENDAR_BASE_URL,
+) -> Iterator[Any]:
+    params = dict(params)
+    streaming = ijson is not None and isinstance(session, AuthorizedSession)
+    while True:
+        if streaming:
+            page: Dict[str, Any] = {}
+            yield from _stream_page_items(session, build_url(path, base_url), params, page)
+        else:
+            page = request(session, "GET", path, params, None, base_url)
+            yield from page.get("items", [])
+        page_token = page.get("nextPageToken")
+        if not page_token:
+            return
+        params["pageToken"] = page_token
+
+
+def build_batch_body(
+    ops: List[Dict[str, Any]], base_url: str = CALENDAR_BASE_URL, start: int = 0
+) -> Tuple[str, bytes]:
+    import uuid
+
+    boundary = f"batch_{uuid.uuid4().hex}"
+    prefix = urlsplit(base_url).path
+    lines: List[str] = []
+    for index, op in enumerate(ops):
+        path = op["path"]
+        if not path.startswith("/"):
+            path = "/" + path
+        target = prefix + path
+        if op.get("params"):
+            target += "?" + urlencode(op["params"], doseq=True)
+        lines.extend(
+            [
+                f"--{boundary}",
+                "Content-Type: application/http",
+                f"Content-ID: <item{start + index + 1}>",
+                "",
+                f"{op.get('method', 'GET').upper()} {target} HTTP/1.1",
+            ]
+        )
+        if op.get("body") is not None:
+            lines.extend(["Content-Type: application/json", "", json_dumps(op["body"]).decode("utf-8")])
+        lines.append("")
+    lines.append(f"--{boundary}--")
+    return boundary, "\r\n".join(lines).encode("utf-8")
+
+
+def parse_batch_response(content_type: str, content: bytes) -> List[Dict[str, Any]]:
+    from email.parser import BytesParser
+
+    header = b"Content-Type: " + content_type.encode("utf-8") + b"\r\n\r\n"
+    message = BytesParser().parsebytes(header + content)
+    if not message.is_multipart():
+        kind = content_type or "no Content-Type"
+        text = content.decode("utf-8", "replace")
+        raise RuntimeError(f"Expected a multipart batch response, got {kind}: {text}")
+    results: List[Dict[str, Any]] = []
+    for position, part in enumerate(message.get_payload()):
+        raw = part.get_payload(decode=True).decode("utf-8").replace("\r\n", "\n")
+        head, _, text = raw.partition("\n\n")
+        status_line = head.split("\n", 1)[0].split()
+        status = int(status_line[1]) if len(status_line) > 1 else 0
+        text = text.strip()
+        try:
+            body: Any = json_loads(text) if text else None
+        except ValueError:
+            body = {"text": text}
+        # Content-ID <response-itemN> echoes the request's <itemN>; parts may come back in any order.
+        match = _BATCH_ITEM_RE.search(part.get("Content-ID", ""))
+        op_id = int(match.group(1)) - 1 if match else position
+        results.append({"id": op_id, "status": status, "body": body})
+    results.sort(key=lambda result: result["id"])
+    return results
+
+
+def batch_request(
+    session: HttpBackend,
+    ops: List[Dict[str, Any]],
+    batch_url: str = CALENDAR_BATCH_URL,
+    base_url: str = CALENDAR_BASE_URL,
+) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    for start in range(0, len(ops), BATCH_MAX_OPS):
+        boundary, payload = build_batch_body(ops[start : start + BATCH_MAX_OPS], base_url, start)
+        response = session.post(
+            batch_url,
+            data=payload,
+            headers={"Content-Type": f"multipart/mixed; boundary={boundary}"},
+        )
+        if response.status_code >= 400:
+            raise RuntimeError(f"HTTP {response.status_code}: {response.text}")
+        results.extend(parse_batch_response(response.headers.get("Content-Type", ""), response.content))
+    return results
+
+
+def _response_body(response: Any) -> Any:
+    if not response.content:
+        return None
+    try:
+        return json_loads(response.content)
+    except ValueError:
+        return {"text": response.text}
+
+
+async def async_request(
+    client: Any,
+    session: Http2Session,
+    op: Dict[str, Any],
+    base_url: str = CALENDAR_BASE_URL,
+) -> Dict[str, Any]:
+    # Never raises: a failed op is reported in its own result so the rest of a bulk run survives.
+    try:
+        method = op.get("method", "GET").upper()
+        url = build_url(op["path"], base_url)
+        data = json_dumps(op["body"]) if op.get("body") is not None else None
+        headers = {"Content-Type": "application/json"} if data is not None else None
+        for attempt in range(2):
+            token = session.creds.token
+            response = await client.request(
+                method,
+                url,
+                params=op.get("params"),
+                content=data,
+                headers=session.auth_headers(headers),
+            )
+            if response.status_code != 401 or attempt or not session.creds.refresh_token:
+                break
+            if session.creds.token == token:
+                session.creds.refresh(auth_request())
+    except Exception as exc:
+        return {"status": None, "error": f"{type(exc).__name__}: {exc}"}
+    return {"status": response.status_code, "body": _response_body(response)}
+
+
+async def run_many(
+    session: Http2Session,
+    ops: List[Dict[str, Any]],
+    base_url: str = CALENDAR_BASE_URL,
+    concurrency: int = BULK_CONCURRENCY,
+    rate: float = BULK_RATE,
+) -> List[Dict[str, Any]]:
+    # At most `concurrency` requests in flight, and starts are spaced to stay under `rate` per second.
+    import asyncio
+
+    httpx = _import_httpx()
+    semaphore = asyncio.Semaphore(concurrency)
+    pacing = asyncio.Lock()
+    interval = 1.0 / rate if rate > 0 else 0.0
+    loop = asyncio.get_running_loop()
+    next_start = loop.time()
+
+    async def send(client: Any, op: Dict[str, Any]) -> Dict[str, Any]:
+        nonlocal next_start
+        async with semaphore:
+            async with pacing:
+                delay = next_start - loop.time()
+                next_start = max(next_start, loop.time()) + interval
+            if delay > 0:
+                await asyncio.sleep(delay)
+            return await async_request(client, session, op, base_url)
+
+    async with httpx.AsyncClient(http2=True, limits=_http2_limits(httpx)) as client:
+        return list(await asyncio.gather(*(send(client, op) for op in ops)))
+
+
+def concurrent_map(
+    session: Http2Session,
+    ops: List[Dict[str, Any]],
+    base_url: str = CALENDAR_BASE_URL,
+    concurrency: int = BULK_CONCURRENCY,
+    rate: float = BULK_RATE,
+) -> List[Dict[str, Any]]:
+    # Runs ops concurrently, multiplexed over a single HTTP/2 connection.
+    # asyncio, uuid and email.parser are imported where used so other commands don't pay for them.
+    import asyncio
+
+    return asyncio.run(run_many(session, ops, base_url, concurrency, rate))
+
+
 def time_object(value: str, time_zone: Optional[str]) -> Dict[str, str]:
     if "T" in value:
         obj = {"dateTime": value}
-        if time_zone and ("Z" not in value and "+" not in value and "-" not in value[10:]):
+        if time_zone and not _TZ_SUFFIX_RE.search(value):
             obj["timeZone"] = time_zone
         return obj
     return {"date": value}
@@ -86,9 +568,9 @@ def time_object(value: str, time_zone: Optional[str]) -> Dict[str, str]:
 
 def parse_bool(value: str) -> bool:
     normalized = value.strip().lower()
-    if normalized in {"true", "1", "yes", "y"}:
+    if normalized in _TRUE:
         return True
-    if normalized in {"false", "0", "no", "n"}:
+    if normalized in _FALSE:
         return False
     raise argparse.ArgumentTypeError("Expected a boolean value (true/false).")
 
@@ -96,10 +578,7 @@ def parse_bool(value: str) -> bool:
 def add_common_auth_args(parser: argparse.ArgumentParser, default_scopes: Optional[list] = None) -> None:
     parser.add_argument(
         "--token",
-        default=os.environ.get(
-            "GCAL_TOKEN_PATH",
-            os.path.expanduser("~/.config/google-calendar/token.json"),
-        ),
+        default=os.environ.get("GCAL_TOKEN_PATH", DEFAULT_TOKEN_PATH),
         help="Path to OAuth token JSON.",
     )
     if default_scopes is None:
@@ -110,17 +589,85 @@ def add_common_auth_args(parser: argparse.ArgumentParser, default_scopes: Option
         default=default_scopes,
         help="OAuth scopes (space separated).",
     )
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        help="Use an HTTP/2 transport (requires httpx[http2]).",
+    )
+    # Also accepted after the subcommand; SUPPRESS keeps the subparser from resetting a top-level --sort-keys.
+    parser.add_argument(
+        "--sort-keys",
+        action="store_true",
+        default=argparse.SUPPRESS,
+        help="Sort keys in the JSON output.",
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _calendar_auth_parent() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(add_help=False)
+    add_common_auth_args(parser)
+    return parser
+
+
+@functools.lru_cache(maxsize=None)
+def _tasks_auth_parent() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(add_help=False)
+    add_common_auth_args(parser, DEFAULT_TASKS_SCOPES)
+    return parser
+
+
+def _bool_param(value: bool) -> str:
+    return "true" if value else "false"
+
+
+# (attribute, API query key, transform). Without a transform the value is sent
+# when truthy; with one it is sent whenever the flag was given at all.
+_LIST_EVENTS_PARAMS = (
+    ("q", "q", None),
+    ("single_events", "singleEvents", None),
+    ("order_by", "orderBy", None),
+    ("max_results", "maxResults", None),
+    ("time_zone", "timeZone", None),
+    ("page_token", "pageToken", None),
+    ("fields", "fields", None),
+)
+
+_LIST_TASKS_PARAMS = (
+    ("completed_max", "completedMax", None),
+    ("completed_min", "completedMin", None),
+    ("due_max", "dueMax", None),
+    ("due_min", "dueMin", None),
+    ("max_results", "maxResults", None),
+    ("page_token", "pageToken", None),
+    ("show_completed", "showCompleted", _bool_param),
+    ("show_deleted", "showDeleted", _bool_param),
+    ("show_hidden", "showHidden", _bool_param),
+    ("show_assigned", "showAssigned", _bool_param),
+    ("updated_min", "updatedMin", None),
+    ("fields", "fields", None),
+)
+
+
+def add_params_from_args(params: Dict[str, Any], args: argparse.Namespace, spec: Tuple[Any, ...]) -> None:
+    for attr, key, transform in spec:
+        value = getattr(args, attr, None)
+        if transform is None:
+            if value:
+                params[key] = value
+        elif value is not None:
+            params[key] = transform(value)
 
 
 def cmd_call(args: argparse.Namespace) -> Any:
     params = load_json_input(args.params, args.params_file)
     body = load_json_input(args.body, args.body_file)
-    session = session_from_token(args.token, args.scopes)
+    session = _get_session(args.token, tuple(args.scopes), args.http2)
     return request(session, args.method.upper(), args.path, params, body)
 
 
 def cmd_list_calendars(args: argparse.Namespace) -> Any:
-    session = session_from_token(args.token, args.scopes)
+    session = _get_session(args.token, tuple(args.scopes), args.http2)
     params = {}
     if args.min_access_role:
         params["minAccessRole"] = args.min_access_role
@@ -132,99 +679,108 @@ def cmd_list_calendars(args: argparse.Namespace) -> Any:
 
 
 def cmd_list_events(args: argparse.Namespace) -> Any:
-    session = session_from_token(args.token, args.scopes)
+    session = _get_session(args.token, tuple(args.scopes), args.http2)
     params: Dict[str, Any] = {
         "timeMin": args.time_min,
         "timeMax": args.time_max,
     }
-    if args.q:
-        params["q"] = args.q
-    if args.single_events:
-        params["singleEvents"] = True
-    if args.order_by:
-        params["orderBy"] = args.order_by
-    if args.max_results:
-        params["maxResults"] = args.max_results
-    if args.time_zone:
-        params["timeZone"] = args.time_zone
-    if args.page_token:
-        params["pageToken"] = args.page_token
-    if args.fields:
-        params["fields"] = args.fields
+    add_params_from_args(params, args, _LIST_EVENTS_PARAMS)
 
-    path = f"/calendars/{args.calendar_id}/events"
+    path = _EVENTS_PATH.format(args.calendar_id)
+    if args.all_pages:
+        return iter_items(session, path, params)
     return request(session, "GET", path, params, None)
 
 
 def cmd_get_event(args: argparse.Namespace) -> Any:
-    session = session_from_token(args.token, args.scopes)
+    session = _get_session(args.token, tuple(args.scopes), args.http2)
     params = {"fields": args.fields} if args.fields else None
-    path = f"/calendars/{args.calendar_id}/events/{args.event_id}"
+    path = _EVENT_PATH.format(args.calendar_id, args.event_id)
     return request(session, "GET", path, params, None)
 
 
+def build_event_body(
+    summary: Optional[str] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    time_zone: Optional[str] = None,
+    location: Optional[str] = None,
+    description: Optional[str] = None,
+    attendees: Optional[str] = None,
+    recurrence: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    body: Dict[str, Any] = {}
+    if summary:
+        body["summary"] = summary
+    if start:
+        body["start"] = time_object(start, time_zone)
+    if end:
+        body["end"] = time_object(end, time_zone)
+    if location:
+        body["location"] = location
+    if description:
+        body["description"] = description
+    if attendees:
+        body["attendees"] = [{"email": match.group(0)} for match in _EMAIL_SPLIT.finditer(attendees)]
+    if recurrence:
+        body["recurrence"] = recurrence
+    return body
+
+
 def cmd_create_event(args: argparse.Namespace) -> Any:
-    session = session_from_token(args.token, args.scopes)
+    session = _get_session(args.token, tuple(args.scopes), args.http2)
     body = load_json_input(args.body, args.body_file)
     if body is None:
         if not args.summary or not args.start or not args.end:
             raise ValueError("--summary, --start, and --end are required unless --body is provided")
-        body = {
-            "summary": args.summary,
-            "start": time_object(args.start, args.time_zone),
-            "end": time_object(args.end, args.time_zone),
-        }
-        if args.location:
-            body["location"] = args.location
-        if args.description:
-            body["description"] = args.description
-        if args.attendees:
-            body["attendees"] = [{"email": email} for email in args.attendees.split(",") if email]
-        if args.recurrence:
-            body["recurrence"] = args.recurrence
-
-    path = f"/calendars/{args.calendar_id}/events"
+        body = build_event_body(
+            summary=args.summary,
+            start=args.start,
+            end=args.end,
+            time_zone=args.time_zone,
+            location=args.location,
+            description=args.description,
+            attendees=args.attendees,
+            recurrence=args.recurrence,
+        )
+
+    path = _EVENTS_PATH.format(args.calendar_id)
     params = {"sendUpdates": args.send_updates} if args.send_updates else None
     return request(session, "POST", path, params, body)
 
 
 def cmd_update_event(args: argparse.Namespace) -> Any:
-    session = session_from_token(args.token, args.scopes)
+    session = _get_session(args.token, tuple(args.scopes), args.http2)
     body = load_json_input(args.body, args.body_file)
     if body is None:
-        body = {}
-        if args.summary:
-            body["summary"] = args.summary
-        if args.start:
-            body["start"] = time_object(args.start, args.time_zone)
-        if args.end:
-            body["end"] = time_object(args.end, args.time_zone)
-        if args.location:
-            body["location"] = args.location
-        if args.description:
-            body["description"] = args.description
-        if args.attendees:
-            body["attendees"] = [{"email": email} for email in args.attendees.split(",") if email]
-        if args.recurrence:
-            body["recurrence"] = args.recurrence
+        body = build_event_body(
+            summary=args.summary,
+            start=args.start,
+            end=args.end,
+            time_zone=args.time_zone,
+            location=args.location,
+            description=args.description,
+            attendees=args.attendees,
+            recurrence=args.recurrence,
+        )
 
     if not body:
         raise ValueError("Provide fields to update or pass --body/--body-file")
 
-    path = f"/calendars/{args.calendar_id}/events/{args.event_id}"
+    path = _EVENT_PATH.format(args.calendar_id, args.event_id)
     params = {"sendUpdates": args.send_updates} if args.send_updates else None
     return request(session, "PATCH", path, params, body)
 
 
 def cmd_delete_event(args: argparse.Namespace) -> Any:
-    session = session_from_token(args.token, args.scopes)
-    path = f"/calendars/{args.calendar_id}/events/{args.event_id}"
+    session = _get_session(args.token, tuple(args.scopes), args.http2)
+    path = _EVENT_PATH.format(args.calendar_id, args.event_id)
     params = {"sendUpdates": args.send_updates} if args.send_updates else None
     return request(session, "DELETE", path, params, None)
 
 
 def cmd_freebusy(args: argparse.Namespace) -> Any:
-    session = session_from_token(args.token, args.scopes)
+    session = _get_session(args.token, tuple(args.scopes), args.http2)
     items = [{"id": cal_id} for cal_id in args.calendars.split(",") if cal_id]
     body = {
         "timeMin": args.time_min,
@@ -237,7 +793,7 @@ def cmd_freebusy(args: argparse.Namespace) -> Any:
 
 
 def cmd_list_tasklists(args: argparse.Namespace) -> Any:
-    session = session_from_token(args.token, args.scopes)
+    session = _get_session(args.token, tuple(args.scopes), args.http2)
     params: Dict[str, Any] = {}
     if args.max_results:
         params["maxResults"] = args.max_results
@@ -249,14 +805,14 @@ def cmd_list_tasklists(args: argparse.Namespace) -> Any:
 
 
 def cmd_get_tasklist(args: argparse.Namespace) -> Any:
-    session = session_from_token(args.token, args.scopes)
+    session = _get_session(args.token, tuple(args.scopes), args.http2)
     params = {"fields": args.fields} if args.fields else None
-    path = f"/users/@me/lists/{args.tasklist}"
+    path = _TASKLIST_PATH.format(args.tasklist)
     return request(session, "GET", path, params, None, TASKS_BASE_URL)
 
 
 def cmd_create_tasklist(args: argparse.Namespace) -> Any:
-    session = session_from_token(args.token, args.scopes)
+    session = _get_session(args.token, tuple(args.scopes), args.http2)
     body = load_json_input(args.body, args.body_file)
     if body is None:
         if not args.title:
@@ -266,7 +822,7 @@ def cmd_create_tasklist(args: argparse.Namespace) -> Any:
 
 
 def cmd_update_tasklist(args: argparse.Namespace) -> Any:
-    session = session_from_token(args.token, args.scopes)
+    session = _get_session(args.token, tuple(args.scopes), args.http2)
     body = load_json_input(args.body, args.body_file)
     if body is None:
         body = {}
@@ -274,13 +830,13 @@ def cmd_update_tasklist(args: argparse.Namespace) -> Any:
             body["title"] = args.title
     if not body:
         raise ValueError("Provide fields to update or pass --body/--body-file")
-    path = f"/users/@me/lists/{args.tasklist}"
+    path = _TASKLIST_PATH.format(args.tasklist)
     return request(session, "PATCH", path, None, body, TASKS_BASE_URL)
 
 
 def cmd_delete_tasklist(args: argparse.Namespace) -> Any:
-    session = session_from_token(args.token, args.scopes)
-    path = f"/users/@me/lists/{args.tasklist}"
+    session = _get_session(args.token, tuple(args.scopes), args.http2)
+    path = _TASKLIST_PATH.format(args.tasklist)
     return request(session, "DELETE", path, None, None, TASKS_BASE_URL)
 
 
@@ -300,45 +856,24 @@ def task_body_from_args(args: argparse.Namespace) -> Dict[str, Any]:
 
 
 def cmd_list_tasks(args: argparse.Namespace) -> Any:
-    session = session_from_token(args.token, args.scopes)
+    session = _get_session(args.token, tuple(args.scopes), args.http2)
     params: Dict[str, Any] = {}
-    if args.completed_max:
-        params["completedMax"] = args.completed_max
-    if args.completed_min:
-        params["completedMin"] = args.completed_min
-    if args.due_max:
-        params["dueMax"] = args.due_max
-    if args.due_min:
-        params["dueMin"] = args.due_min
-    if args.max_results:
-        params["maxResults"] = args.max_results
-    if args.page_token:
-        params["pageToken"] = args.page_token
-    if args.show_completed is not None:
-        params["showCompleted"] = "true" if args.show_completed else "false"
-    if args.show_deleted is not None:
-        params["showDeleted"] = "true" if args.show_deleted else "false"
-    if args.show_hidden is not None:
-        params["showHidden"] = "true" if args.show_hidden else "false"
-    if args.show_assigned is not None:
-        params["showAssigned"] = "true" if args.show_assigned else "false"
-    if args.updated_min:
-        params["updatedMin"] = args.updated_min
-    if args.fields:
-        params["fields"] = args.fields
-    path = f"/lists/{args.tasklist}/tasks"
+    add_params_from_args(params, args, _LIST_TASKS_PARAMS)
+    path = _TASKS_PATH.format(args.tasklist)
+    if args.all_pages:
+        return iter_items(session, path, params, TASKS_BASE_URL)
     return request(session, "GET", path, params, None, TASKS_BASE_URL)
 
 
 def cmd_get_task(args: argparse.Namespace) -> Any:
-    session = session_from_token(args.token, args.scopes)
+    session = _get_session(args.token, tuple(args.scopes), args.http2)
     params = {"fields": args.fields} if args.fields else None
-    path = f"/lists/{args.tasklist}/tasks/{args.task_id}"
+    path = _TASK_PATH.format(args.tasklist, args.task_id)
     return request(session, "GET", path, params, None, TASKS_BASE_URL)
 
 
 def cmd_create_task(args: argparse.Namespace) -> Any:
-    session = session_from_token(args.token, args.scopes)
+    session = _get_session(args.token, tuple(args.scopes), args.http2)
     body = load_json_input(args.body, args.body_file)
     if body is None:
         if not args.title:
@@ -349,29 +884,29 @@ def cmd_create_task(args: argparse.Namespace) -> Any:
         params["parent"] = args.parent
     if args.previous:
         params["previous"] = args.previous
-    path = f"/lists/{args.tasklist}/tasks"
+    path = _TASKS_PATH.format(args.tasklist)
     return request(session, "POST", path, params, body, TASKS_BASE_URL)
 
 
 def cmd_update_task(args: argparse.Namespace) -> Any:
-    session = session_from_token(args.token, args.scopes)
+    session = _get_session(args.token, tuple(args.scopes), args.http2)
     body = load_json_input(args.body, args.body_file)
     if body is None:
         body = task_body_from_args(args)
     if not body:
         raise ValueError("Provide fields to update or pass --body/--body-file")
-    path = f"/lists/{args.tasklist}/tasks/{args.task_id}"
+    path = _TASK_PATH.format(args.tasklist, args.task_id)
     return request(session, "PATCH", path, None, body, TASKS_BASE_URL)
 
 
 def cmd_delete_task(args: argparse.Namespace) -> Any:
-    session = session_from_token(args.token, args.scopes)
-    path = f"/lists/{args.tasklist}/tasks/{args.task_id}"
+    session = _get_session(args.token, tuple(args.scopes), args.http2)
+    path = _TASK_PATH.format(args.tasklist, args.task_id)
     return request(session, "DELETE", path, None, None, TASKS_BASE_URL)
 
 
 def cmd_move_task(args: argparse.Namespace) -> Any:
-    session = session_from_token(args.token, args.scopes)
+    session = _get_session(args.token, tuple(args.scopes), args.http2)
     params: Dict[str, Any] = {}
     if args.parent:
         params["parent"] = args.parent
@@ -379,22 +914,47 @@ def cmd_move_task(args: argparse.Namespace) -> Any:
         params["previous"] = args.previous
     if args.destination_tasklist:
         params["destinationTasklist"] = args.destination_tasklist
-    path = f"/lists/{args.tasklist}/tasks/{args.task_id}/move"
+    path = _TASK_MOVE_PATH.format(args.tasklist, args.task_id)
     return request(session, "POST", path, params, None, TASKS_BASE_URL)
 
 
 def cmd_clear_tasks(args: argparse.Namespace) -> Any:
-    session = session_from_token(args.token, args.scopes)
-    path = f"/lists/{args.tasklist}/clear"
+    session = _get_session(args.token, tuple(args.scopes), args.http2)
+    path = _TASKS_CLEAR_PATH.format(args.tasklist)
     return request(session, "POST", path, None, None, TASKS_BASE_URL)
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="Google Calendar + Tasks API CLI.")
-    subparsers = parser.add_subparsers(dest="command", required=True)
+def load_ops_file(path: str) -> List[Dict[str, Any]]:
+    with open(path, "rb") as handle:
+        ops = json_loads(handle.read())
+    if not isinstance(ops, list):
+        raise ValueError("--ops-file must contain a JSON array of {method, path, body, params}")
+    return ops
+
+
+def cmd_batch(args: argparse.Namespace) -> Any:
+    ops = load_ops_file(args.ops_file)
+    session = _get_session(args.token, tuple(args.scopes), args.http2)
+    if args.api == "tasks":
+        return batch_request(session, ops, TASKS_BATCH_URL, TASKS_BASE_URL)
+    return batch_request(session, ops)
+
+
+def cmd_bulk(args: argparse.Namespace) -> Any:
+    ops = load_ops_file(args.ops_file)
+    if args.concurrency < 1:
+        raise ValueError("--concurrency must be at least 1")
+    session = Http2Session(load_credentials(args.token, list(args.scopes)))
+    base_url = TASKS_BASE_URL if args.api == "tasks" else CALENDAR_BASE_URL
+    return concurrent_map(session, ops, base_url, args.concurrency, args.rate)
 
-    call_parser = subparsers.add_parser("call", help="Call an arbitrary Calendar API endpoint")
-    add_common_auth_args(call_parser)
+
+def _build_call(subparsers: argparse._SubParsersAction) -> None:
+    call_parser = subparsers.add_parser(
+        "call",
+        parents=[_calendar_auth_parent()],
+        help="Call an arbitrary Calendar API endpoint",
+    )
     call_parser.add_argument("method", help="HTTP method (GET/POST/PATCH/DELETE)")
     call_parser.add_argument("path", help="API path, e.g., /calendars/primary/events")
     call_parser.add_argument("--params", help="Query params as JSON string")
@@ -403,15 +963,25 @@ def build_parser() -> argparse.ArgumentParser:
     call_parser.add_argument("--body-file", help="Path to request body JSON file")
     call_parser.set_defaults(func=cmd_call)
 
-    list_cal_parser = subparsers.add_parser("list-calendars", help="List calendars")
-    add_common_auth_args(list_cal_parser)
+
+def _build_list_calendars(subparsers: argparse._SubParsersAction) -> None:
+    list_cal_parser = subparsers.add_parser(
+        "list-calendars",
+        parents=[_calendar_auth_parent()],
+        help="List calendars",
+    )
     list_cal_parser.add_argument("--min-access-role", help="Filter by minimum access role")
     list_cal_parser.add_argument("--max-results", type=int, help="Max results")
     list_cal_parser.add_argument("--page-token", help="Page token")
     list_cal_parser.set_defaults(func=cmd_list_calendars)
 
-    list_events_parser = subparsers.add_parser("list-events", help="List events")
-    add_common_auth_args(list_events_parser)
+
+def _build_list_events(subparsers: argparse._SubParsersAction) -> None:
+    list_events_parser = subparsers.add_parser(
+        "list-events",
+        parents=[_calendar_auth_parent()],
+        help="List events",
+    )
     list_events_parser.add_argument("--calendar-id", required=True, help="Calendar ID (or 'primary')")
     list_events_parser.add_argument("--time-min", required=True, help="RFC3339 start time")
     list_events_parser.add_argument("--time-max", required=True, help="RFC3339 end time")
@@ -422,17 +992,28 @@ def build_parser() -> argparse.ArgumentParser:
     list_events_parser.add_argument("--time-zone", help="IANA timezone")
     list_events_parser.add_argument("--page-token", help="Page token")
     list_events_parser.add_argument("--fields", help="Partial response fields")
+    list_events_parser.add_argument("--all-pages", action="store_true", help="Fetch all pages")
     list_events_parser.set_defaults(func=cmd_list_events)
 
-    get_event_parser = subparsers.add_parser("get-event", help="Get an event")
-    add_common_auth_args(get_event_parser)
+
+def _build_get_event(subparsers: argparse._SubParsersAction) -> None:
+    get_event_parser = subparsers.add_parser(
+        "get-event",
+        parents=[_calendar_auth_parent()],
+        help="Get an event",
+    )
     get_event_parser.add_argument("--calendar-id", required=True, help="Calendar ID")
     get_event_parser.add_argument("--event-id", required=True, help="Event ID")
     get_event_parser.add_argument("--fields", help="Partial response fields")
     get_event_parser.set_defaults(func=cmd_get_event)
 
-    create_parser = subparsers.add_parser("create-event", help="Create an event")
-    add_common_auth_args(create_parser)
+
+def _build_create_event(subparsers: argparse._SubParsersAction) -> None:
+    create_parser = subparsers.add_parser(
+        "create-event",
+        parents=[_calendar_auth_parent()],
+        help="Create an event",
+    )
     create_parser.add_argument("--calendar-id", required=True, help="Calendar ID")
     create_parser.add_argument("--summary", help="Event title")
     create_parser.add_argument("--start", help="Start time (RFC3339 or date)")
@@ -447,8 +1028,13 @@ def build_parser() -> argparse.ArgumentParser:
     create_parser.add_argument("--body-file", help="Path to request body JSON file")
     create_parser.set_defaults(func=cmd_create_event)
 
-    update_parser = subparsers.add_parser("update-event", help="Update an event")
-    add_common_auth_args(update_parser)
+
+def _build_update_event(subparsers: argparse._SubParsersAction) -> None:
+    update_parser = subparsers.add_parser(
+        "update-event",
+        parents=[_calendar_auth_parent()],
+        help="Update an event",
+    )
     update_parser.add_argument("--calendar-id", required=True, help="Calendar ID")
     update_parser.add_argument("--event-id", required=True, help="Event ID")
     update_parser.add_argument("--summary", help="Event title")
@@ -464,56 +1050,96 @@ def build_parser() -> argparse.ArgumentParser:
     update_parser.add_argument("--body-file", help="Path to request body JSON file")
     update_parser.set_defaults(func=cmd_update_event)
 
-    delete_parser = subparsers.add_parser("delete-event", help="Delete an event")
-    add_common_auth_args(delete_parser)
+
+def _build_delete_event(subparsers: argparse._SubParsersAction) -> None:
+    delete_parser = subparsers.add_parser(
+        "delete-event",
+        parents=[_calendar_auth_parent()],
+        help="Delete an event",
+    )
     delete_parser.add_argument("--calendar-id", required=True, help="Calendar ID")
     delete_parser.add_argument("--event-id", required=True, help="Event ID")
     delete_parser.add_argument("--send-updates", help="all|externalOnly|none")
     delete_parser.set_defaults(func=cmd_delete_event)
 
-    freebusy_parser = subparsers.add_parser("freebusy", help="Free/busy query")
-    add_common_auth_args(freebusy_parser)
+
+def _build_freebusy(subparsers: argparse._SubParsersAction) -> None:
+    freebusy_parser = subparsers.add_parser(
+        "freebusy",
+        parents=[_calendar_auth_parent()],
+        help="Free/busy query",
+    )
     freebusy_parser.add_argument("--calendars", required=True, help="Comma-separated calendar IDs")
     freebusy_parser.add_argument("--time-min", required=True, help="RFC3339 start time")
     freebusy_parser.add_argument("--time-max", required=True, help="RFC3339 end time")
     freebusy_parser.add_argument("--time-zone", help="IANA timezone")
     freebusy_parser.set_defaults(func=cmd_freebusy)
 
-    list_tasklists_parser = subparsers.add_parser("list-tasklists", help="List task lists")
-    add_common_auth_args(list_tasklists_parser, DEFAULT_TASKS_SCOPES)
+
+def _build_list_tasklists(subparsers: argparse._SubParsersAction) -> None:
+    list_tasklists_parser = subparsers.add_parser(
+        "list-tasklists",
+        parents=[_tasks_auth_parent()],
+        help="List task lists",
+    )
     list_tasklists_parser.add_argument("--max-results", type=int, help="Max results")
     list_tasklists_parser.add_argument("--page-token", help="Page token")
     list_tasklists_parser.add_argument("--fields", help="Partial response fields")
     list_tasklists_parser.set_defaults(func=cmd_list_tasklists)
 
-    get_tasklist_parser = subparsers.add_parser("get-tasklist", help="Get a task list")
-    add_common_auth_args(get_tasklist_parser, DEFAULT_TASKS_SCOPES)
+
+def _build_get_tasklist(subparsers: argparse._SubParsersAction) -> None:
+    get_tasklist_parser = subparsers.add_parser(
+        "get-tasklist",
+        parents=[_tasks_auth_parent()],
+        help="Get a task list",
+    )
     get_tasklist_parser.add_argument("--tasklist", required=True, help="Task list ID")
     get_tasklist_parser.add_argument("--fields", help="Partial response fields")
     get_tasklist_parser.set_defaults(func=cmd_get_tasklist)
 
-    create_tasklist_parser = subparsers.add_parser("create-tasklist", help="Create a task list")
-    add_common_auth_args(create_tasklist_parser, DEFAULT_TASKS_SCOPES)
+
+def _build_create_tasklist(subparsers: argparse._SubParsersAction) -> None:
+    create_tasklist_parser = subparsers.add_parser(
+        "create-tasklist",
+        parents=[_tasks_auth_parent()],
+        help="Create a task list",
+    )
     create_tasklist_parser.add_argument("--title", help="Task list title")
     create_tasklist_parser.add_argument("--body", help="Request body as JSON string")
     create_tasklist_parser.add_argument("--body-file", help="Path to request body JSON file")
     create_tasklist_parser.set_defaults(func=cmd_create_tasklist)
 
-    update_tasklist_parser = subparsers.add_parser("update-tasklist", help="Update a task list")
-    add_common_auth_args(update_tasklist_parser, DEFAULT_TASKS_SCOPES)
+
+def _build_update_tasklist(subparsers: argparse._SubParsersAction) -> None:
+    update_tasklist_parser = subparsers.add_parser(
+        "update-tasklist",
+        parents=[_tasks_auth_parent()],
+        help="Update a task list",
+    )
     update_tasklist_parser.add_argument("--tasklist", required=True, help="Task list ID")
     update_tasklist_parser.add_argument("--title", help="Task list title")
     update_tasklist_parser.add_argument("--body", help="Request body as JSON string")
     update_tasklist_parser.add_argument("--body-file", help="Path to request body JSON file")
     update_tasklist_parser.set_defaults(func=cmd_update_tasklist)
 
-    delete_tasklist_parser = subparsers.add_parser("delete-tasklist", help="Delete a task list")
-    add_common_auth_args(delete_tasklist_parser, DEFAULT_TASKS_SCOPES)
+
+def _build_delete_tasklist(subparsers: argparse._SubParsersAction) -> None:
+    delete_tasklist_parser = subparsers.add_parser(
+        "delete-tasklist",
+        parents=[_tasks_auth_parent()],
+        help="Delete a task list",
+    )
     delete_tasklist_parser.add_argument("--tasklist", required=True, help="Task list ID")
     delete_tasklist_parser.set_defaults(func=cmd_delete_tasklist)
 
-    list_tasks_parser = subparsers.add_parser("list-tasks", help="List tasks in a task list")
-    add_common_auth_args(list_tasks_parser, DEFAULT_TASKS_SCOPES)
+
+def _build_list_tasks(subparsers: argparse._SubParsersAction) -> None:
+    list_tasks_parser = subparsers.add_parser(
+        "list-tasks",
+        parents=[_tasks_auth_parent()],
+        help="List tasks in a task list",
+    )
     list_tasks_parser.add_argument("--tasklist", required=True, help="Task list ID")
     list_tasks_parser.add_argument("--completed-max", help="RFC3339 completion time upper bound")
     list_tasks_parser.add_argument("--completed-min", help="RFC3339 completion time lower bound")
@@ -527,17 +1153,24 @@ def build_parser() -> argparse.ArgumentParser:
     list_tasks_parser.add_argument("--show-assigned", type=parse_bool, help="true/false")
     list_tasks_parser.add_argument("--updated-min", help="RFC3339 updated time lower bound")
     list_tasks_parser.add_argument("--fields", help="Partial response fields")
+    list_tasks_parser.add_argument("--all-pages", action="store_true", help="Fetch all pages")
     list_tasks_parser.set_defaults(func=cmd_list_tasks)
 
-    get_task_parser = subparsers.add_parser("get-task", help="Get a task")
-    add_common_auth_args(get_task_parser, DEFAULT_TASKS_SCOPES)
+
+def _build_get_task(subparsers: argparse._SubParsersAction) -> None:
+    get_task_parser = subparsers.add_parser("get-task", parents=[_tasks_auth_parent()], help="Get a task")
     get_task_parser.add_argument("--tasklist", required=True, help="Task list ID")
     get_task_parser.add_argument("--task-id", required=True, help="Task ID")
     get_task_parser.add_argument("--fields", help="Partial response fields")
     get_task_parser.set_defaults(func=cmd_get_task)
 
-    create_task_parser = subparsers.add_parser("create-task", help="Create a task")
-    add_common_auth_args(create_task_parser, DEFAULT_TASKS_SCOPES)
+
+def _build_create_task(subparsers: argparse._SubParsersAction) -> None:
+    create_task_parser = subparsers.add_parser(
+        "create-task",
+        parents=[_tasks_auth_parent()],
+        help="Create a task",
+    )
     create_task_parser.add_argument("--tasklist", required=True, help="Task list ID")
     create_task_parser.add_argument("--title", help="Task title")
     create_task_parser.add_argument("--notes", help="Task notes")
@@ -550,8 +1183,13 @@ def build_parser() -> argparse.ArgumentParser:
     create_task_parser.add_argument("--body-file", help="Path to request body JSON file")
     create_task_parser.set_defaults(func=cmd_create_task)
 
-    update_task_parser = subparsers.add_parser("update-task", help="Update a task")
-    add_common_auth_args(update_task_parser, DEFAULT_TASKS_SCOPES)
+
+def _build_update_task(subparsers: argparse._SubParsersAction) -> None:
+    update_task_parser = subparsers.add_parser(
+        "update-task",
+        parents=[_tasks_auth_parent()],
+        help="Update a task",
+    )
     update_task_parser.add_argument("--tasklist", required=True, help="Task list ID")
     update_task_parser.add_argument("--task-id", required=True, help="Task ID")
     update_task_parser.add_argument("--title", help="Task title")
@@ -563,14 +1201,20 @@ def build_parser() -> argparse.ArgumentParser:
     update_task_parser.add_argument("--body-file", help="Path to request body JSON file")
     update_task_parser.set_defaults(func=cmd_update_task)
 
-    delete_task_parser = subparsers.add_parser("delete-task", help="Delete a task")
-    add_common_auth_args(delete_task_parser, DEFAULT_TASKS_SCOPES)
+
+def _build_delete_task(subparsers: argparse._SubParsersAction) -> None:
+    delete_task_parser = subparsers.add_parser(
+        "delete-task",
+        parents=[_tasks_auth_parent()],
+        help="Delete a task",
+    )
     delete_task_parser.add_argument("--tasklist", required=True, help="Task list ID")
     delete_task_parser.add_argument("--task-id", required=True, help="Task ID")
     delete_task_parser.set_defaults(func=cmd_delete_task)
 
-    move_task_parser = subparsers.add_parser("move-task", help="Move a task")
-    add_common_auth_args(move_task_parser, DEFAULT_TASKS_SCOPES)
+
+def _build_move_task(subparsers: argparse._SubParsersAction) -> None:
+    move_task_parser = subparsers.add_parser("move-task", parents=[_tasks_auth_parent()], help="Move a task")
     move_task_parser.add_argument("--tasklist", required=True, help="Task list ID")
     move_task_parser.add_argument("--task-id", required=True, help="Task ID")
     move_task_parser.add_argument("--parent", help="New parent task ID")
@@ -578,25 +1222,109 @@ def build_parser() -> argparse.ArgumentParser:
     move_task_parser.add_argument("--destination-tasklist", help="Destination task list ID")
     move_task_parser.set_defaults(func=cmd_move_task)
 
-    clear_tasks_parser = subparsers.add_parser("clear-tasks", help="Clear completed tasks")
-    add_common_auth_args(clear_tasks_parser, DEFAULT_TASKS_SCOPES)
+
+def _build_clear_tasks(subparsers: argparse._SubParsersAction) -> None:
+    clear_tasks_parser = subparsers.add_parser(
+        "clear-tasks",
+        parents=[_tasks_auth_parent()],
+        help="Clear completed tasks",
+    )
     clear_tasks_parser.add_argument("--tasklist", required=True, help="Task list ID")
     clear_tasks_parser.set_defaults(func=cmd_clear_tasks)
 
+
+def _build_batch(subparsers: argparse._SubParsersAction) -> None:
+    batch_parser = subparsers.add_parser(
+        "batch",
+        parents=[_calendar_auth_parent()],
+        help="Send multiple requests in one multipart batch",
+    )
+    batch_parser.add_argument("--ops-file", required=True, help="Path to JSON array of operations")
+    batch_parser.add_argument("--api", choices=["calendar", "tasks"], default="calendar", help="Target API")
+    batch_parser.set_defaults(func=cmd_batch)
+
+
+def _build_bulk(subparsers: argparse._SubParsersAction) -> None:
+    bulk_parser = subparsers.add_parser(
+        "bulk",
+        parents=[_calendar_auth_parent()],
+        help="Run many requests concurrently over HTTP/2 (requires httpx[http2])",
+    )
+    bulk_parser.add_argument("--ops-file", required=True, help="Path to JSON array of operations")
+    bulk_parser.add_argument("--api", choices=["calendar", "tasks"], default="calendar", help="Target API")
+    bulk_parser.add_argument("--concurrency", type=int, default=BULK_CONCURRENCY, help="Max in flight")
+    bulk_parser.add_argument("--rate", type=float, default=BULK_RATE, help="Max requests started per second")
+    bulk_parser.set_defaults(func=cmd_bulk)
+
+
+SUBCOMMANDS = {
+    "call": _build_call,
+    "list-calendars": _build_list_calendars,
+    "list-events": _build_list_events,
+    "get-event": _build_get_event,
+    "create-event": _build_create_event,
+    "update-event": _build_update_event,
+    "delete-event": _build_delete_event,
+    "freebusy": _build_freebusy,
+    "list-tasklists": _build_list_tasklists,
+    "get-tasklist": _build_get_tasklist,
+    "create-tasklist": _build_create_tasklist,
+    "update-tasklist": _build_update_tasklist,
+    "delete-tasklist": _build_delete_tasklist,
+    "list-tasks": _build_list_tasks,
+    "get-task": _build_get_task,
+    "create-task": _build_create_task,
+    "update-task": _build_update_task,
+    "delete-task": _build_delete_task,
+    "move-task": _build_move_task,
+    "clear-tasks": _build_clear_tasks,
+    "batch": _build_batch,
+    "bulk": _build_bulk,
+}
+
+
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Google Calendar + Tasks API CLI.")
+    parser.add_argument(
+        "--sort-keys",
+        action="store_true",
+        help="Sort keys in the JSON output (Google already returns fields in a stable order).",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    if command in SUBCOMMANDS:
+        SUBCOMMANDS[command](subparsers)
+    else:
+        for builder in SUBCOMMANDS.values():
+            builder(subparsers)
     return parser
 
 
+def _peek_command(argv: List[str]) -> Optional[str]:
+    for arg in argv:
+        if arg in ("-h", "--help"):
+            return None
+        if not arg.startswith("-"):
+            return arg
+    return None
+
+
 def main() -> int:
-    parser = build_parser()
+    # Only build the requested subcommand; --help and unknown commands get all of them.
+    parser = build_parser(_peek_command(sys.argv[1:]))
     args = parser.parse_args()
 
     try:
         result = args.func(args)
+        if isinstance(result, Iterator):
+            write_json_items(result, sys.stdout.buffer, args.sort_keys)
+        else:
+            write_json(result, sys.stdout.buffer, args.sort_keys)
     except Exception as exc:
+        sys.stdout.flush()
         print(f"Error: {exc}", file=sys.stderr)
         return 1
-
-    print(json.dumps(result, indent=2, sort_keys=True))
+    finally:
+        wait_for_background_refresh()
     return 0
 
 
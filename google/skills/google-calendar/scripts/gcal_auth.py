@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 import argparse
+import json
 import os
-import pathlib
 import sys
+from typing import TYPE_CHECKING, Optional, Tuple
 
-from google_auth_oauthlib.flow import InstalledAppFlow
+from token_store import auth_request, write_token
+
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
 
 DEFAULT_SCOPES = [
     "https://www.googleapis.com/auth/calendar",
@@ -46,32 +50,105 @@ def parse_args() -> argparse.Namespace:
         default=0,
         help="Local server port for auth (0 = auto).",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Run the interactive flow even if a usable token exists.",
+    )
     return parser.parse_args()
 
 
 def ensure_parent(path: str) -> None:
-    parent = pathlib.Path(path).expanduser().resolve().parent
-    parent.mkdir(parents=True, exist_ok=True)
+    parent = os.path.dirname(os.path.abspath(os.path.expanduser(path)))
+    os.makedirs(parent, exist_ok=True)
+
+
+def stored_refresh_token(token_path: str, scopes: list) -> Optional[str]:
+    # Only a refresh token whose recorded grant covers the requested scopes is worth keeping.
+    try:
+        with open(token_path, "r", encoding="utf-8") as handle:
+            info = json.load(handle)
+        if not set(scopes).issubset(info.get("scopes") or ()):
+            return None
+        return info.get("refresh_token")
+    except (OSError, ValueError, AttributeError, TypeError):
+        return None
+
+
+def with_refresh_token(creds: "Credentials", refresh_token: str) -> "Credentials":
+    from google.oauth2.credentials import Credentials
+
+    return Credentials(
+        token=creds.token,
+        refresh_token=refresh_token,
+        token_uri=creds.token_uri,
+        client_id=creds.client_id,
+        client_secret=creds.client_secret,
+        scopes=creds.scopes,
+        expiry=creds.expiry,
+    )
+
+
+def reuse_existing_token(token_path: str, scopes: list) -> Tuple[bool, bool]:
+    # Returns (reused, refresh_failed).
+    if not os.path.exists(token_path):
+        return False, False
+    from google.oauth2.credentials import Credentials
+
+    try:
+        creds = Credentials.from_authorized_user_file(token_path)
+    except ValueError:
+        return False, False
+    if not creds.has_scopes(scopes):
+        return False, False
+    if creds.valid:
+        print(f"Token still valid: {token_path}")
+        return True, False
+    if not (creds.expired and creds.refresh_token):
+        return False, False
+    try:
+        creds.refresh(auth_request())
+    except Exception as exc:
+        print(f"Token refresh failed, starting interactive auth: {exc}", file=sys.stderr)
+        return False, True
+    write_token(token_path, creds.to_json())
+    print(f"Token refreshed: {token_path}")
+    return True, False
 
 
 def main() -> int:
     args = parse_args()
 
-    credentials_path = pathlib.Path(args.credentials).expanduser().resolve()
-    if not credentials_path.exists():
+    token_path = os.path.abspath(os.path.expanduser(args.token))
+    ensure_parent(token_path)
+
+    reused, refresh_failed = (False, False) if args.force else reuse_existing_token(token_path, args.scopes)
+    if reused:
+        return 0
+
+    # The client secrets are only needed for the interactive flow.
+    credentials_path = os.path.abspath(os.path.expanduser(args.credentials))
+    if not os.path.isfile(credentials_path):
         print(f"Credentials file not found: {credentials_path}", file=sys.stderr)
         return 2
 
-    ensure_parent(args.token)
+    # Deferred so --help and the cached-token path skip the oauthlib import cost.
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
+    # Google only issues a refresh token on first consent, so ask for consent again unless we hold
+    # a stored one that covers these scopes and has not just been rejected.
+    previous_refresh_token = None if refresh_failed else stored_refresh_token(token_path, args.scopes)
+    auth_kwargs = {} if previous_refresh_token else {"access_type": "offline", "prompt": "consent"}
 
-    flow = InstalledAppFlow.from_client_secrets_file(str(credentials_path), scopes=args.scopes)
+    flow = InstalledAppFlow.from_client_secrets_file(credentials_path, scopes=args.scopes)
     if args.no_browser:
-        creds = flow.run_console()
+        creds = flow.run_console(**auth_kwargs)
     else:
-        creds = flow.run_local_server(port=args.port)
+        creds = flow.run_local_server(port=args.port, **auth_kwargs)
+    if creds.refresh_token is None and previous_refresh_token:
+        creds = with_refresh_token(creds, previous_refresh_token)
 
-    token_path = pathlib.Path(args.token).expanduser().resolve()
-    token_path.write_text(creds.to_json())
+    write_token(token_path, creds.to_json())
     print(f"Token saved to: {token_path}")
     return 0
 
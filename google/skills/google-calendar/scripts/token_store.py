@@ -0,0 +1,41 @@
+import functools
+import os
+import tempfile
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from google.auth.transport.requests import Request
+
+
+@functools.lru_cache(maxsize=None)
+def auth_request() -> "Request":
+    import requests
+    from google.auth.transport.requests import Request
+    from requests.adapters import HTTPAdapter
+
+    # One keep-alive session for token refreshes instead of a new one per refresh.
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+    return Request(session=session)
+
+
+def write_token(token_path: str, token_json: str) -> None:
+    # Write a uniquely named 0600 temp file next to the token, then rename it into place.
+    # An interrupted or concurrent write never leaves a truncated or world-readable token.
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(token_path), prefix=".token-", suffix=".tmp")
+    try:
+        view = memoryview(token_json.encode("utf-8"))
+        while view:
+            view = view[os.write(fd, view) :]
+        os.fsync(fd)
+        os.close(fd)
+        fd = -1
+        os.replace(tmp_path, token_path)
+    except BaseException:
+        if fd != -1:
+            os.close(fd)
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise